@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import socket
 import time
 
 from oslo_log import log as logging
@@ -35,6 +36,7 @@ class LiveMigrationTestBase(base.BaseV2ComputeAdminTest):
     """Test live migration operations supported by admin user"""
 
     create_default_network = True
+    block_migration = None
 
     @classmethod
     def skip_checks(cls):
@@ -57,19 +59,49 @@ class LiveMigrationTestBase(base.BaseV2ComputeAdminTest):
         cls.ports_client = cls.os_primary.ports_client
         cls.trunks_client = cls.os_primary.trunks_client
 
+    @classmethod
+    def resource_setup(cls):
+        super(LiveMigrationTestBase, cls).resource_setup()
+        # The request microversion and the config do not change during the
+        # lifetime of the class, so resolve them once for all migrations.
+        cls.disk_over_commit_supported = (
+            cls.is_requested_microversion_compatible('2.24'))
+        cls.block_migration_for_live_migration = (
+            CONF.compute_feature_enabled.block_migration_for_live_migration)
+        cls.can_migrate_between_any_hosts = (
+            CONF.compute_feature_enabled.can_migrate_between_any_hosts)
+
+    def _get_target_host(self, server_id):
+        if not self.can_migrate_between_any_hosts:
+            # not to specify a host so that the scheduler will pick one
+            return None
+        return self.get_host_other_than(server_id)
+
     def _migrate_server_to(self, server_id, dest_host, volume_backed=False):
         kwargs = dict()
-        block_migration = getattr(self, 'block_migration', None)
-        if self.block_migration is None:
-            if self.is_requested_microversion_compatible('2.24'):
+        block_migration = self.block_migration
+        if block_migration is None:
+            if self.disk_over_commit_supported:
                 kwargs['disk_over_commit'] = False
-            block_migration = (CONF.compute_feature_enabled.
-                               block_migration_for_live_migration and
+            block_migration = (self.block_migration_for_live_migration and
                                not volume_backed)
         self.admin_servers_client.live_migrate_server(
             server_id, host=dest_host, block_migration=block_migration,
             **kwargs)
 
+    def _migration_failure_msg(self, server_id, actual_host):
+        migration_list = (self.admin_migration_client.list_migrations()
+                          ['migrations'])
+
+        msg = ("Live Migration failed, instance %s is on host %s. "
+               "Migrations list for Instance %s: [" %
+               (server_id, actual_host, server_id))
+        for live_migration in migration_list:
+            if (live_migration['instance_uuid'] == server_id):
+                msg += "\n%s" % live_migration
+        msg += "]"
+        return msg
+
     def _live_migrate(self, server_id, target_host, state,
                       volume_backed=False):
         # If target_host is None, check whether source host is different with
@@ -78,26 +110,18 @@ class LiveMigrationTestBase(base.BaseV2ComputeAdminTest):
             source_host = self.get_host_for_server(server_id)
         self._migrate_server_to(server_id, target_host, volume_backed)
         waiters.wait_for_server_status(self.servers_client, server_id, state)
-        migration_list = (self.admin_migration_client.list_migrations()
-                          ['migrations'])
-
-        msg = ("Live Migration failed. Migrations list for Instance "
-               "%s: [" % server_id)
-        for live_migration in migration_list:
-            if (live_migration['instance_uuid'] == server_id):
-                msg += "\n%s" % live_migration
-        msg += "]"
+        actual_host = self.get_host_for_server(server_id)
         if target_host is None:
-            self.assertNotEqual(source_host,
-                                self.get_host_for_server(server_id), msg)
+            migrated = source_host != actual_host
         else:
-            self.assertEqual(target_host, self.get_host_for_server(server_id),
-                             msg)
+            migrated = target_host == actual_host
+        if not migrated:
+            # Only fetch the migrations list to build the failure message.
+            self.fail(self._migration_failure_msg(server_id, actual_host))
 
 
 class LiveMigrationTest(LiveMigrationTestBase):
     max_microversion = '2.24'
-    block_migration = None
 
     @classmethod
     def setup_credentials(cls):
@@ -118,22 +142,26 @@ class LiveMigrationTest(LiveMigrationTestBase):
         # Live migrate an instance to another host
         server_id = self.create_test_server(wait_until="ACTIVE",
                                             volume_backed=volume_backed)['id']
-        source_host = self.get_host_for_server(server_id)
-        if not CONF.compute_feature_enabled.can_migrate_between_any_hosts:
-            # not to specify a host so that the scheduler will pick one
-            destination_host = None
-        else:
-            destination_host = self.get_host_other_than(server_id)
+        back_and_forth = (
+            CONF.compute_feature_enabled.live_migrate_back_and_forth)
+        # The source host is only needed to migrate the server back to it.
+        if back_and_forth:
+            source_host = self.get_host_for_server(server_id)
+        destination_host = self._get_target_host(server_id)
 
         if state == 'PAUSED':
             self.admin_servers_client.pause_server(server_id)
             waiters.wait_for_server_status(self.admin_servers_client,
                                            server_id, state)
 
-        LOG.info("Live migrate from source %s to destination %s",
-                 source_host, destination_host)
+        if back_and_forth:
+            LOG.info("Live migrate from source %s to destination %s",
+                     source_host, destination_host)
+        else:
+            LOG.info("Live migrate server %s to destination %s",
+                     server_id, destination_host)
         self._live_migrate(server_id, destination_host, state, volume_backed)
-        if CONF.compute_feature_enabled.live_migrate_back_and_forth:
+        if back_and_forth:
             # If live_migrate_back_and_forth is enabled it is a grenade job.
             # Therefore test should validate whether LM is compatible in both
             # ways, so live migrate VM back to the source host
@@ -193,19 +221,14 @@ class LiveMigrationTest(LiveMigrationTestBase):
             validation_resources=validation_resources,
             wait_until="SSHABLE")
         server_id = server['id']
-        if not CONF.compute_feature_enabled.can_migrate_between_any_hosts:
-            # not to specify a host so that the scheduler will pick one
-            target_host = None
-        else:
-            target_host = self.get_host_other_than(server_id)
+        target_host = self._get_target_host(server_id)
 
         volume = self.create_volume()
 
         # Attach the volume to the server
         self.attach_volume(server, volume, device='/dev/xvdb',
                            wait_for_detach=False)
-        server = self.admin_servers_client.show_server(server_id)['server']
-        volume_id1 = server["os-extended-volumes:volumes_attached"][0]["id"]
+        volume_id1 = volume['id']
         self._live_migrate(server_id, target_host, 'ACTIVE')
 
         server = self.admin_servers_client.show_server(server_id)['server']
@@ -254,9 +277,30 @@ class LiveMigrationTest(LiveMigrationTestBase):
                                      trunk['id'])
         return trunk, parent, subport
 
-    def _is_port_status_active(self, port_id):
-        port = self.ports_client.show_port(port_id)['port']
-        return port['status'] == 'ACTIVE'
+    def _wait_until(self, func, duration, *args, initial_interval=0.25,
+                    max_interval=5.0):
+        """Call func until it returns True or the duration elapses.
+
+        Unlike test_utils.call_until_true, the sleep between unsuccessful
+        calls starts at initial_interval and doubles on each attempt up to
+        max_interval, so fast transitions are noticed quickly while slow ones
+        are not polled too often.
+        """
+        interval = initial_interval
+        deadline = time.monotonic() + duration
+        while True:
+            if func(*args):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(max_interval, interval * 2)
+
+    def _are_ports_status_active(self, port_ids):
+        ports = self.ports_client.list_ports(id=port_ids)['ports']
+        return (len(ports) == len(port_ids) and
+                all(port['status'] == 'ACTIVE' for port in ports))
 
     @decorators.attr(type='multinode')
     @decorators.idempotent_id('0022c12e-a482-42b0-be2d-396b5f0cffe3')
@@ -269,47 +313,37 @@ class LiveMigrationTest(LiveMigrationTestBase):
         server = self.create_test_server(
             wait_until="ACTIVE", networks=[{'port': parent['id']}])
 
-        # Wait till subport status is ACTIVE
-        self.assertTrue(
-            test_utils.call_until_true(
-                self._is_port_status_active, CONF.validation.connect_timeout,
-                5, subport['id']))
+        # Wait till subport and parent port status are ACTIVE
         self.assertTrue(
-            test_utils.call_until_true(
-                self._is_port_status_active, CONF.validation.connect_timeout,
-                5, parent['id']))
-        subport = self.ports_client.show_port(subport['id'])['port']
+            self._wait_until(self._are_ports_status_active,
+                             CONF.validation.connect_timeout,
+                             [subport['id'], parent['id']]))
 
-        if not CONF.compute_feature_enabled.can_migrate_between_any_hosts:
-            # not to specify a host so that the scheduler will pick one
-            target_host = None
-        else:
-            target_host = self.get_host_other_than(server['id'])
+        target_host = self._get_target_host(server['id'])
 
         self._live_migrate(server['id'], target_host, 'ACTIVE')
 
-        # Wait till subport status is ACTIVE
+        # Wait till subport and parent port status are ACTIVE
         self.assertTrue(
-            test_utils.call_until_true(
-                self._is_port_status_active, CONF.validation.connect_timeout,
-                5, subport['id']))
-        self.assertTrue(
-            test_utils.call_until_true(
-                self._is_port_status_active, CONF.validation.connect_timeout,
-                5, parent['id']))
+            self._wait_until(self._are_ports_status_active,
+                             CONF.validation.connect_timeout,
+                             [subport['id'], parent['id']]))
 
 
 class LiveMigrationRemoteConsolesV26Test(LiveMigrationTestBase):
     min_microversion = '2.6'
     max_microversion = 'latest'
 
+    @classmethod
+    def skip_checks(cls):
+        super(LiveMigrationRemoteConsolesV26Test, cls).skip_checks()
+        if not CONF.compute_feature_enabled.serial_console:
+            raise cls.skipException('Serial console not supported.')
+        if not compute.is_scheduler_filter_enabled("DifferentHostFilter"):
+            raise cls.skipException('DifferentHostFilter is not available.')
+
     @decorators.attr(type='multinode')
     @decorators.idempotent_id('6190af80-513e-4f0f-90f2-9714e84955d7')
-    @testtools.skipUnless(CONF.compute_feature_enabled.serial_console,
-                          'Serial console not supported.')
-    @testtools.skipUnless(
-        compute.is_scheduler_filter_enabled("DifferentHostFilter"),
-        'DifferentHostFilter is not available.')
     def test_live_migration_serial_console(self):
         """Test the live-migration of an instance which has a serial console
 
@@ -345,27 +379,47 @@ class LiveMigrationRemoteConsolesV26Test(LiveMigrationTestBase):
                                                       console_type='serial',
                                                       protocol='serial')
         console_url = body['remote_console']['url']
-        data = "test_live_migration_serial_console"
-        console_output = ''
-        t = 0.0
-        interval = 0.1
+        data = b"test_live_migration_serial_console"
+        console_output = b''
+        # NOTE (markus_z): It can take a long time until the terminal
+        # of the instance is available for interaction. Hence the
+        # long timeout value.
+        deadline = time.monotonic() + 120.0
 
         ws = compute.create_websocket(console_url)
         try:
-            # NOTE (markus_z): It can take a long time until the terminal
-            # of the instance is available for interaction. Hence the
-            # long timeout value.
-            while data not in console_output and t <= 120.0:
+            # Block on the socket instead of sleeping between polls, so we
+            # return as soon as the echo of the probe arrives.
+            ws.settimeout(5.0)
+            send_probe = True
+            while data not in console_output and time.monotonic() <= deadline:
                 try:
-                    ws.send_frame(data)
+                    if send_probe:
+                        ws.send_frame(data)
+                        send_probe = False
                     received = ws.receive_frame()
+                    if received is None:
+                        raise socket.error('WebSocket connection closed')
                     console_output += received
+                except socket.timeout:
+                    # Nothing was echoed back in time as the terminal may
+                    # not be ready yet. receive_frame() only raises a
+                    # timeout between frames, so the connection is still
+                    # usable and we only resend the probe.
+                    send_probe = True
                 except Exception:
-                    # In case we had an issue with send/receive on the
-                    # websocket connection, we create a new one.
+                    # In case the websocket connection is broken, we
+                    # close it and create a new one and resend the probe.
+                    # Wait a bit first, so a proxy that keeps rejecting the
+                    # connection is not hammered with reconnects.
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+                    time.sleep(1.0)
                     ws = compute.create_websocket(console_url)
-                time.sleep(interval)
-                t += interval
+                    ws.settimeout(5.0)
+                    send_probe = True
         finally:
             ws.close()
         self.assertIn(data, console_output)
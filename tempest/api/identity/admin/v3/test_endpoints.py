@@ -76,7 +76,7 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         """Test listing keystone endpoints by filters"""
         # Get the list of all the endpoints.
         fetched_endpoints = self.client.list_endpoints()['endpoints']
-        fetched_endpoint_ids = [e['id'] for e in fetched_endpoints]
+        fetched_endpoint_ids = {e['id'] for e in fetched_endpoints}
         # Check that all the created endpoints are present in
         # "fetched_endpoints".
         missing_endpoints =\
@@ -108,9 +108,9 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         # Check that the expected endpoint_id is present per filter. [0] is
         # public and [1] is internal.
         self.assertIn(self.setup_endpoint_ids[0],
-                      [e['id'] for e in fetched_public_endpoints])
+                      {e['id'] for e in fetched_public_endpoints})
         self.assertIn(self.setup_endpoint_ids[1],
-                      [e['id'] for e in fetched_internal_endpoints])
+                      {e['id'] for e in fetched_internal_endpoints})
 
     @decorators.idempotent_id('0e2446d2-c1fd-461b-a729-b9e73e3e3b37')
     def test_create_list_show_delete_endpoint(self):
@@ -130,12 +130,7 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         self.assertEqual(region_name, endpoint['region'])
         self.assertEqual(url, endpoint['url'])
 
-        # Checking if created endpoint is present in the list of endpoints
-        fetched_endpoints = self.client.list_endpoints()['endpoints']
-        fetched_endpoints_id = [e['id'] for e in fetched_endpoints]
-        self.assertIn(endpoint['id'], fetched_endpoints_id)
-
-        # Show endpoint
+        # Show endpoint, listing endpoints is covered by test_list_endpoints
         fetched_endpoint = (
             self.client.show_endpoint(endpoint['id'])['endpoint'])
         # Asserting if the attributes of endpoint are the same
@@ -143,14 +138,14 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         self.assertEqual(interface, fetched_endpoint['interface'])
         self.assertEqual(url, fetched_endpoint['url'])
         self.assertEqual(region_name, fetched_endpoint['region'])
-        self.assertEqual(True, fetched_endpoint['enabled'])
+        self.assertTrue(fetched_endpoint['enabled'])
 
         # Deleting the endpoint created in this method
         self.client.delete_endpoint(endpoint['id'])
 
         # Checking whether endpoint is deleted successfully
         fetched_endpoints = self.client.list_endpoints()['endpoints']
-        fetched_endpoints_id = [e['id'] for e in fetched_endpoints]
+        fetched_endpoints_id = {e['id'] for e in fetched_endpoints}
         self.assertNotIn(endpoint['id'], fetched_endpoints_id)
 
     @decorators.attr(type='smoke')
@@ -163,12 +158,8 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         # when deleting endpoint_for_update if endpoint's service is deleted.
 
         # Creating service for updating endpoint with new service ID
-        s_name = data_utils.rand_name('service')
-        s_type = data_utils.rand_name('type')
-        s_description = data_utils.rand_name('description')
-        service2 = self._create_service(s_name=s_name, s_type=s_type,
-                                        s_description=s_description)
-        self.addCleanup(self.services_client.delete_service, service2['id'])
+        service2_id = self._create_service()['id']
+        self.addCleanup(self.services_client.delete_service, service2_id)
 
         # Creating an endpoint so as to check update endpoint with new values
         region1_name = data_utils.rand_name('region')
@@ -187,7 +178,7 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         url2 = data_utils.rand_url()
         interface2 = 'internal'
         endpoint = self.client.update_endpoint(endpoint_for_update['id'],
-                                               service_id=service2['id'],
+                                               service_id=service2_id,
                                                interface=interface2,
                                                url=url2, region=region2_name,
                                                enabled=False)['endpoint']
@@ -196,8 +187,8 @@ class EndPointsTestJSON(base.BaseIdentityV3AdminTest):
         self.addCleanup(self.client.delete_endpoint, endpoint_for_update['id'])
 
         # Asserting if the attributes of endpoint are updated
-        self.assertEqual(service2['id'], endpoint['service_id'])
+        self.assertEqual(service2_id, endpoint['service_id'])
         self.assertEqual(interface2, endpoint['interface'])
         self.assertEqual(url2, endpoint['url'])
         self.assertEqual(region2_name, endpoint['region'])
-        self.assertEqual(False, endpoint['enabled'])
+        self.assertFalse(endpoint['enabled'])
@@ -14,7 +14,6 @@
 #    under the License.
 
 import testtools
-from testtools import matchers
 
 from tempest.api.volume import base
 from tempest.common import utils
@@ -25,6 +24,8 @@ from tempest.lib import decorators
 
 CONF = config.CONF
 
+BACKUP_DESCRIPTION_PREFIX = "volume-backup-description"
+
 
 class VolumesBackupsTest(base.BaseVolumeTest):
     """Test volumes backup"""
@@ -37,6 +38,11 @@ class VolumesBackupsTest(base.BaseVolumeTest):
         if not CONF.volume_feature_enabled.backup:
             raise cls.skipException("Cinder backup feature disabled")
 
+    @classmethod
+    def resource_setup(cls):
+        super(VolumesBackupsTest, cls).resource_setup()
+        cls.backup_name_prefix = cls.__name__ + '-Backup'
+
     def restore_backup(self, backup_id):
         # Restore a backup
         restored_volume = self.backups_client.restore_backup(
@@ -61,10 +67,9 @@ class VolumesBackupsTest(base.BaseVolumeTest):
 
         1. Create volume1 with metadata
         2. Create backup1 from volume1
-        3. Show backup1
-        4. List backups with detail
-        5. Restore backup1
-        6. Verify backup1 has been restored successfully with the metadata
+        3. List backups with detail and verify the details of backup1
+        4. Restore backup1
+        5. Verify backup1 has been restored successfully with the metadata
            of volume1
         """
         # Create a volume with metadata
@@ -75,9 +80,8 @@ class VolumesBackupsTest(base.BaseVolumeTest):
         self.addCleanup(self.delete_volume, self.volumes_client, volume['id'])
 
         # Create a backup
-        backup_name = data_utils.rand_name(
-            self.__class__.__name__ + '-Backup')
-        description = data_utils.rand_name("volume-backup-description")
+        backup_name = data_utils.rand_name(self.backup_name_prefix)
+        description = data_utils.rand_name(BACKUP_DESCRIPTION_PREFIX)
         backup = self.create_backup(volume_id=volume['id'],
                                     name=backup_name,
                                     description=description,
@@ -86,16 +90,19 @@ class VolumesBackupsTest(base.BaseVolumeTest):
         waiters.wait_for_volume_resource_status(self.volumes_client,
                                                 volume['id'], 'available')
 
-        # Get a given backup
-        backup = self.backups_client.show_backup(backup['id'])['backup']
-        self.assertEqual(backup_name, backup['name'])
-        self.assertEqual(description, backup['description'])
-        self.assertEqual('container', backup['container'])
-
-        # Get all backups with detail
-        backups = self.backups_client.list_backups(detail=True)['backups']
-        self.assertIn((backup['name'], backup['id']),
-                      [(m['name'], m['id']) for m in backups])
+        # List backups with detail, the listed backup has the same details
+        # show_backup would return. Filter on the backup name so the size of
+        # the response does not depend on the number of backups in the cloud.
+        backups = self.backups_client.list_backups(
+            detail=True, name=backup_name)['backups']
+        listed_backup = next(
+            (m for m in backups if m['id'] == backup['id']), None)
+        self.assertIsNotNone(
+            listed_backup,
+            'Backup %s not found in the list of backups' % backup['id'])
+        self.assertEqual(backup_name, listed_backup['name'])
+        self.assertEqual(description, listed_backup['description'])
+        self.assertEqual('container', listed_backup['container'])
 
         restored_volume = self.restore_backup(backup['id'])
 
@@ -104,8 +111,9 @@ class VolumesBackupsTest(base.BaseVolumeTest):
 
         # Verify the backup has been restored successfully
         # with the metadata of the source volume.
-        self.assertThat(restored_volume_metadata.items(),
-                        matchers.ContainsAll(metadata.items()))
+        self.assertLessEqual(metadata.items(),
+                             restored_volume_metadata.items(),
+                             'Metadata of the source volume not restored')
 
     @decorators.idempotent_id('07af8f6d-80af-44c9-a5dc-c8427b1b62e6')
     @utils.services('compute')
@@ -118,7 +126,7 @@ class VolumesBackupsTest(base.BaseVolumeTest):
         # Create a server
         volume = self.create_volume()
         self.addCleanup(self.delete_volume, self.volumes_client, volume['id'])
-        validation_resources = self.get_test_validation_resources(
+        validation_resources = self.get_class_validation_resources(
             self.os_primary)
         server = self.create_server(wait_until='SSHABLE',
                                     validation_resources=validation_resources,
@@ -126,8 +134,7 @@ class VolumesBackupsTest(base.BaseVolumeTest):
         # Attach volume to instance
         self.attach_volume(server['id'], volume['id'])
         # Create backup using force flag
-        backup_name = data_utils.rand_name(
-            self.__class__.__name__ + '-Backup')
+        backup_name = data_utils.rand_name(self.backup_name_prefix)
         backup = self.create_backup(volume_id=volume['id'],
                                     name=backup_name, force=True)
         waiters.wait_for_volume_resource_status(self.volumes_client,
@@ -179,6 +186,11 @@ class VolumesBackupsV39Test(base.BaseVolumeTest):
         if not CONF.volume_feature_enabled.backup:
             raise cls.skipException("Cinder backup feature disabled")
 
+    @classmethod
+    def resource_setup(cls):
+        super(VolumesBackupsV39Test, cls).resource_setup()
+        cls.backup_name_prefix = cls.__name__ + '-Backup'
+
     @decorators.idempotent_id('9b374cbc-be5f-4d37-8848-7efb8a873dcc')
     def test_update_backup(self):
         """Test updating backup's name and description"""
@@ -190,8 +202,8 @@ class VolumesBackupsV39Test(base.BaseVolumeTest):
 
         # Update backup and assert response body for update_backup method
         update_kwargs = {
-            'name': data_utils.rand_name(self.__class__.__name__ + '-Backup'),
-            'description': data_utils.rand_name("volume-backup-description")
+            'name': data_utils.rand_name(self.backup_name_prefix),
+            'description': data_utils.rand_name(BACKUP_DESCRIPTION_PREFIX)
         }
         update_backup = self.backups_client.update_backup(
             backup['id'], **update_kwargs)['backup']
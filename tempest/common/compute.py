@@ -448,7 +448,16 @@ class _WebSocket(object):
         # or no data was received (meaning the socket was closed).  This is
         # done to handle the case where we get back some empty frames
         while True:
-            header = self._recv(2)
+            # A timeout is only passed on as is when no byte of the frame
+            # has been consumed yet. Otherwise the stream is out of sync,
+            # so report it as a broken connection instead.
+            frame_started = len(self.cached_stream) > 0
+            try:
+                header = self._recv(2)
+            except socket.timeout:
+                if not frame_started:
+                    raise
+                raise socket.error('WebSocket frame partially received')
             # If we didn't receive any data, just return None
             if not header:
                 return None
@@ -457,7 +466,10 @@ class _WebSocket(object):
             # that only the 2nd byte contains the length, and since the
             # server doesn't do masking, we can just read the data length
             if int(header[1]) & 127 > 0:
-                return self._recv(int(header[1]) & 127)
+                try:
+                    return self._recv(int(header[1]) & 127)
+                except socket.timeout:
+                    raise socket.error('WebSocket frame partially received')
 
     def send_frame(self, data):
         """Wrapper for sending data to add in the WebSocket frame format."""
@@ -479,6 +491,10 @@ class _WebSocket(object):
         frame_bytes = struct.pack('!%iB' % len(frame_bytes), * frame_bytes)
         self._socket.sendall(frame_bytes)
 
+    def settimeout(self, timeout):
+        """Set the timeout in seconds for blocking operations on the socket."""
+        self._socket.settimeout(timeout)
+
     def close(self):
         """Helper method to close the connection."""
         # Close down the real socket connection and exit the test program
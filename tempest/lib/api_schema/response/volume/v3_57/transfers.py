@@ -13,8 +13,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import copy
-
 from tempest.lib.api_schema.response.compute.v2_1 import parameter_types
 from tempest.lib.api_schema.response.volume.v3_55 import transfers
 
@@ -24,38 +22,72 @@ from tempest.lib.api_schema.response.volume.v3_55 import transfers
 #   'source_project_id'
 #   'accepted'
 
-create_volume_transfer = copy.deepcopy(transfers.create_volume_transfer)
-create_volume_transfer['response_body']['properties']['transfer'][
-    'properties'].update(
-        {'destination_project_id': parameter_types.uuid_or_null})
-create_volume_transfer['response_body']['properties']['transfer'][
-    'properties'].update(
-        {'source_project_id': {'type': 'string', 'format': 'uuid'}})
-create_volume_transfer['response_body']['properties']['transfer'][
-    'properties'].update(
-        {'accepted': {'type': 'boolean'}})
-
-common_show_volume_transfer = copy.deepcopy(
-    transfers.common_show_volume_transfer)
-common_show_volume_transfer['properties'].update(
-    {'destination_project_id': parameter_types.uuid_or_null})
-common_show_volume_transfer['properties'].update(
-    {'source_project_id': {'type': 'string', 'format': 'uuid'}})
-common_show_volume_transfer['properties'].update(
-    {'accepted': {'type': 'boolean'}})
-
-show_volume_transfer = copy.deepcopy(transfers.show_volume_transfer)
-show_volume_transfer['response_body']['properties'][
-    'transfer'] = common_show_volume_transfer
-
-list_volume_transfers_no_detail = copy.deepcopy(
-    transfers.list_volume_transfers_no_detail)
-
-list_volume_transfers_with_detail = copy.deepcopy(
-    transfers.list_volume_transfers_with_detail)
-list_volume_transfers_with_detail['response_body']['properties']['transfers'][
-    'items'] = common_show_volume_transfer
-
-delete_volume_transfer = copy.deepcopy(transfers.delete_volume_transfer)
-
-accept_volume_transfer = copy.deepcopy(transfers.accept_volume_transfer)
+# NOTE: Only the dicts along the path to the modified 'properties' are
+# rebuilt, everything else is shared with the 3.55 schema instead of being
+# deep-copied. Schemas must therefore never be modified in place.
+_transfer_properties = {
+    'destination_project_id': parameter_types.uuid_or_null,
+    'source_project_id': {'type': 'string', 'format': 'uuid'},
+    'accepted': {'type': 'boolean'}
+}
+
+_create_response_body = transfers.create_volume_transfer['response_body']
+_create_transfer = _create_response_body['properties']['transfer']
+create_volume_transfer = {
+    **transfers.create_volume_transfer,
+    'response_body': {
+        **_create_response_body,
+        'properties': {
+            **_create_response_body['properties'],
+            'transfer': {
+                **_create_transfer,
+                'properties': {
+                    **_create_transfer['properties'],
+                    **_transfer_properties
+                }
+            }
+        }
+    }
+}
+
+common_show_volume_transfer = {
+    **transfers.common_show_volume_transfer,
+    'properties': {
+        **transfers.common_show_volume_transfer['properties'],
+        **_transfer_properties
+    }
+}
+
+_show_response_body = transfers.show_volume_transfer['response_body']
+show_volume_transfer = {
+    **transfers.show_volume_transfer,
+    'response_body': {
+        **_show_response_body,
+        'properties': {
+            **_show_response_body['properties'],
+            'transfer': common_show_volume_transfer
+        }
+    }
+}
+
+list_volume_transfers_no_detail = transfers.list_volume_transfers_no_detail
+
+_list_response_body = (
+    transfers.list_volume_transfers_with_detail['response_body'])
+list_volume_transfers_with_detail = {
+    **transfers.list_volume_transfers_with_detail,
+    'response_body': {
+        **_list_response_body,
+        'properties': {
+            **_list_response_body['properties'],
+            'transfers': {
+                **_list_response_body['properties']['transfers'],
+                'items': common_show_volume_transfer
+            }
+        }
+    }
+}
+
+delete_volume_transfer = transfers.delete_volume_transfer
+
+accept_volume_transfer = transfers.accept_volume_transfer
@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import socket
 from unittest import mock
 
 from urllib import parse as urlparse
@@ -105,3 +106,43 @@ class TestCompute(base.TestCase):
         self.assertEqual(recv_version, RFP_VERSION)
         # cached_stream should be empty in the end.
         self.assertEqual(webSocket.cached_stream, b'')
+
+    def test_settimeout(self):
+        self.client_sock.recv.side_effect = [
+            b'fake response start\r\n',
+            b'fake response end\r\n\r\n']
+        webSocket = compute._WebSocket(self.client_sock, self.url)
+
+        webSocket.settimeout(5.0)
+
+        self.client_sock.settimeout.assert_called_once_with(5.0)
+
+    def test_receive_frame_timeout_before_frame(self):
+        self.client_sock.recv.side_effect = [
+            b'fake response start\r\n',
+            b'fake response end\r\n\r\n',
+            socket.timeout()]
+        webSocket = compute._WebSocket(self.client_sock, self.url)
+
+        self.assertRaises(socket.timeout, webSocket.receive_frame)
+
+    def test_receive_frame_timeout_mid_frame(self):
+        self.client_sock.recv.side_effect = [
+            b'fake response start\r\n',
+            b'fake response end\r\n\r\n',
+            b'\x82\x0c',
+            socket.timeout()]
+        webSocket = compute._WebSocket(self.client_sock, self.url)
+
+        exc = self.assertRaises(socket.error, webSocket.receive_frame)
+        self.assertNotIsInstance(exc, socket.timeout)
+
+    def test_receive_frame_timeout_after_cached_bytes(self):
+        self.client_sock.recv.side_effect = [
+            b'fake response start\r\n',
+            b'fake response end\r\n\r\n\x82',
+            socket.timeout()]
+        webSocket = compute._WebSocket(self.client_sock, self.url)
+
+        exc = self.assertRaises(socket.error, webSocket.receive_frame)
+        self.assertNotIsInstance(exc, socket.timeout)